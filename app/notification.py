@@ -2,18 +2,20 @@
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+
 import structlog
-from jinja2 import Template
+from jinja2 import Environment
 
 from emoji import emojize
 
-from notifiers.twilio_client import TwilioNotifier
-from notifiers.slack_client import SlackNotifier
-from notifiers.discord_client import DiscordNotifier
-from notifiers.gmail_client import GmailNotifier
-from notifiers.telegram_client import TelegramNotifier
-from notifiers.webhook_client import WebhookNotifier
-from notifiers.stdout_client import StdoutNotifier
+HOT_EMOJI = emojize(":hotsprings: ", use_aliases=True)
+COLD_EMOJI = emojize(":snowman: ", use_aliases=True)
+PRIMARY_EMOJI = emojize(":ok_hand: ", use_aliases=True)
+GEM_EMOJI = emojize(":gem:", use_aliases=True)
+
+JINJA_ENV = Environment(auto_reload=False)
 
 
 class Notifier():
@@ -28,62 +30,71 @@ class Notifier():
         """
 
         self.config = config
-        self.logger = structlog.get_logger()
+        self.logger = structlog.get_logger().bind(component='notifier')
         self.notifier_config = notifier_config
         self.last_analysis = dict()
-
-        self.hotImoji = emojize(":hotsprings: ", use_aliases=True)
-        self.coldImoji = emojize(":snowman: ", use_aliases=True)
-        self.primaryImoji = emojize(":ok_hand: ", use_aliases=True)
+        self._template_cache = dict()
+        self._compiled_templates = dict()
+        self._template_nonempty = dict()
 
         enabled_notifiers = list()
-        self.logger = structlog.get_logger()
         self.twilio_configured = self._validate_required_config('twilio', notifier_config)
         if self.twilio_configured:
+            from notifiers.twilio_client import TwilioNotifier
             self.twilio_client = TwilioNotifier(
                 twilio_key=notifier_config['twilio']['required']['key'],
                 twilio_secret=notifier_config['twilio']['required']['secret'],
                 twilio_sender_number=notifier_config['twilio']['required']['sender_number'],
                 twilio_receiver_number=notifier_config['twilio']['required']['receiver_number']
             )
+            self._load_notifier_template('twilio', notifier_config)
             enabled_notifiers.append('twilio')
 
         self.discord_configured = self._validate_required_config('discord', notifier_config)
         if self.discord_configured:
+            from notifiers.discord_client import DiscordNotifier
             self.discord_client = DiscordNotifier(
                 webhook=notifier_config['discord']['required']['webhook'],
                 username=notifier_config['discord']['required']['username'],
                 avatar=notifier_config['discord']['optional']['avatar']
             )
+            self._load_notifier_template('discord', notifier_config)
             enabled_notifiers.append('discord')
 
         self.slack_configured = self._validate_required_config('slack', notifier_config)
         if self.slack_configured:
+            from notifiers.slack_client import SlackNotifier
             self.slack_client = SlackNotifier(
                 slack_webhook=notifier_config['slack']['required']['webhook']
             )
+            self._load_notifier_template('slack', notifier_config)
             enabled_notifiers.append('slack')
 
         self.gmail_configured = self._validate_required_config('gmail', notifier_config)
         if self.gmail_configured:
+            from notifiers.gmail_client import GmailNotifier
             self.gmail_client = GmailNotifier(
                 username=notifier_config['gmail']['required']['username'],
                 password=notifier_config['gmail']['required']['password'],
                 destination_addresses=notifier_config['gmail']['required']['destination_emails']
             )
+            self._load_notifier_template('gmail', notifier_config)
             enabled_notifiers.append('gmail')
 
         self.telegram_configured = self._validate_required_config('telegram', notifier_config)
         if self.telegram_configured:
+            from notifiers.telegram_client import TelegramNotifier
             self.telegram_client = TelegramNotifier(
                 token=notifier_config['telegram']['required']['token'],
                 chat_id=notifier_config['telegram']['required']['chat_id'],
                 parse_mode=notifier_config['telegram']['optional']['parse_mode']
             )
+            self._load_notifier_template('telegram', notifier_config)
             enabled_notifiers.append('telegram')
 
         self.webhook_configured = self._validate_required_config('webhook', notifier_config)
         if self.webhook_configured:
+            from notifiers.webhook_client import WebhookNotifier
             self.webhook_client = WebhookNotifier(
                 url=notifier_config['webhook']['required']['url'],
                 username=notifier_config['webhook']['optional']['username'],
@@ -93,25 +104,57 @@ class Notifier():
 
         self.stdout_configured = self._validate_required_config('stdout', notifier_config)
         if self.stdout_configured:
+            from notifiers.stdout_client import StdoutNotifier
             self.stdout_client = StdoutNotifier()
+            self._load_notifier_template('stdout', notifier_config)
             enabled_notifiers.append('stdout')
 
         self.logger.info('enabled notifers: %s', enabled_notifiers)
+        self._enabled_notifiers = enabled_notifiers
+        # Only notify_all delivers concurrently, so its thread pool is created on first use.
+        self._executor = None
 
     def notify_all(self, new_analysis):
         """Trigger a notification for all notification options.
 
+        The messages are rendered first and then delivered concurrently, so a slow or failing
+        notifier does not hold up the others.
+
         Args:
             new_analysis (dict): The new_analysis to send.
         """
 
-        self.notify_slack(new_analysis)
-        self.notify_discord(new_analysis)
-        self.notify_twilio(new_analysis)
-        self.notify_gmail(new_analysis)
-        self.notify_telegram(new_analysis)
-        self.notify_webhook(new_analysis)
-        self.notify_stdout(new_analysis)
+        deliveries = list()
+        rendered_messages = dict()
+        for notifier in ['slack', 'discord', 'twilio', 'gmail', 'telegram', 'stdout']:
+            if notifier in self._compiled_templates and self._template_nonempty[notifier]:
+                # Notifiers sharing a template share its compiled object, so render it only once.
+                message_template = self._compiled_templates[notifier]
+                if message_template not in rendered_messages:
+                    rendered_messages[message_template] = self._indicator_message_templater(
+                        new_analysis,
+                        message_template
+                    )
+                message = rendered_messages[message_template]
+                if message.strip():
+                    deliveries.append((notifier, message))
+
+        if self.webhook_configured:
+            deliveries.append(('webhook', self._webhook_message(new_analysis)))
+
+        if deliveries and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self._enabled_notifiers))
+
+        futures = dict()
+        for notifier, message in deliveries:
+            notifier_client = getattr(self, '{}_client'.format(notifier))
+            futures[self._executor.submit(notifier_client.notify, message)] = notifier
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as ex:
+                self.logger.error("Failed to send %s notification: %s", futures[future], ex)
 
     def notify_all_new(self, new_analysis):
         """Trigger a notification for all notification options.
@@ -123,7 +166,7 @@ class Notifier():
 
         self._indicator_message_templater(
             new_analysis,
-            self.notifier_config['slack']['optional']['template']
+            self._get_template(self.notifier_config['slack']['optional']['template'])
         )
         print()
 
@@ -134,10 +177,10 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.discord_configured:
+        if self.discord_configured and self._template_nonempty['discord']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['discord']['optional']['template']
+                self._compiled_templates['discord']
             )
             if message.strip():
                 self.discord_client.notify(message)
@@ -149,10 +192,10 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.slack_configured:
+        if self.slack_configured and self._template_nonempty['slack']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['slack']['optional']['template']
+                self._compiled_templates['slack']
             )
             if message.strip():
                 self.slack_client.notify(message)
@@ -164,10 +207,10 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.twilio_configured:
+        if self.twilio_configured and self._template_nonempty['twilio']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['twilio']['optional']['template']
+                self._compiled_templates['twilio']
             )
             if message.strip():
                 self.twilio_client.notify(message)
@@ -179,10 +222,10 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.gmail_configured:
+        if self.gmail_configured and self._template_nonempty['gmail']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['gmail']['optional']['template']
+                self._compiled_templates['gmail']
             )
             if message.strip():
                 self.gmail_client.notify(message)
@@ -194,10 +237,10 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.telegram_configured:
+        if self.telegram_configured and self._template_nonempty['telegram']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['telegram']['optional']['template']
+                self._compiled_templates['telegram']
             )
             if message.strip():
                 self.telegram_client.notify(message)
@@ -210,18 +253,7 @@ class Notifier():
         """
 
         if self.webhook_configured:
-            for exchange in new_analysis:
-                for market in new_analysis[exchange]:
-                    for indicator_type in new_analysis[exchange][market]:
-                        for indicator in new_analysis[exchange][market][indicator_type]:
-                            for index, analysis in enumerate(new_analysis[exchange][market][indicator_type][indicator]):
-                                analysis_dict = analysis['result'].to_dict(orient='records')
-                                if analysis_dict:
-                                    new_analysis[exchange][market][indicator_type][indicator][index] = analysis_dict[-1]
-                                else:
-                                    new_analysis[exchange][market][indicator_type][indicator][index] = ''
-
-            self.webhook_client.notify(new_analysis)
+            self.webhook_client.notify(self._webhook_message(new_analysis))
 
     def notify_stdout(self, new_analysis):
         """Send a notification via the stdout notifier
@@ -230,14 +262,53 @@ class Notifier():
             new_analysis (dict): The new_analysis to send.
         """
 
-        if self.stdout_configured:
+        if self.stdout_configured and self._template_nonempty['stdout']:
             message = self._indicator_message_templater(
                 new_analysis,
-                self.notifier_config['stdout']['optional']['template']
+                self._compiled_templates['stdout']
             )
             if message.strip():
                 self.stdout_client.notify(message)
 
+    def _walk(self, new_analysis):
+        """Iterate over every analysis result in a single flat pass.
+
+        Args:
+            new_analysis (dict): A dictionary of data related to the analysis.
+
+        Yields:
+            tuple: The exchange, market, indicator type, indicator, index and analysis.
+        """
+
+        for exchange, markets in new_analysis.items():
+            for market, indicator_types in markets.items():
+                for indicator_type, indicators in indicator_types.items():
+                    for indicator, analyses in indicators.items():
+                        for index, analysis in enumerate(analyses):
+                            yield exchange, market, indicator_type, indicator, index, analysis
+
+    def _webhook_message(self, new_analysis):
+        """Reduce the analysis to the latest result of each indicator for the webhook notifier
+
+        Args:
+            new_analysis (dict): The new_analysis to send.
+
+        Returns:
+            dict: A copy of the analysis with each result replaced by its latest row.
+        """
+
+        webhook_message = dict()
+        for exchange, market, indicator_type, indicator, _, analysis in self._walk(new_analysis):
+            market_results = webhook_message.setdefault(exchange, dict()).setdefault(market, dict())
+            latest_results = market_results.setdefault(indicator_type, dict()).setdefault(indicator, list())
+            if analysis['result'].shape[0]:
+                # Records keep native Python types, so the payload stays JSON serializable
+                latest_results.append(analysis['result'].iloc[[-1]].to_dict(orient='records')[0])
+            else:
+                latest_results.append('')
+
+        return webhook_message
+
     def _validate_required_config(self, notifier, notifier_config):
         """Validate the required configuration items are present for a notifier.
 
@@ -249,198 +320,237 @@ class Notifier():
             bool: Is the notifier configured?
         """
 
-        notifier_configured = True
-        for _, val in notifier_config[notifier]['required'].items():
-            if not val:
-                notifier_configured = False
-        return notifier_configured
+        return all(notifier_config[notifier]['required'].values())
 
-    def _indicator_message_templater(self, new_analysis, template):
+    def _get_template(self, template):
+        """Get a compiled Jinja template, compiling it only the first time it is seen.
+
+        Args:
+            template (str): A Jinja formatted message template.
+
+        Returns:
+            Template: The compiled template.
+        """
+
+        message_template = self._template_cache.get(template)
+        if message_template is None:
+            message_template = JINJA_ENV.from_string(template)
+            self._template_cache[template] = message_template
+        return message_template
+
+    def _load_notifier_template(self, notifier, notifier_config):
+        """Compile the template of a configured notifier and note whether it has any content.
+
+        Args:
+            notifier (str): The name of the notifier key in default-config.json
+            notifier_config (dict): A dictionary containing configuration for the notifications.
+        """
+
+        template = notifier_config[notifier]['optional']['template']
+        self._compiled_templates[notifier] = self._get_template(template)
+        self._template_nonempty[notifier] = bool(template.strip())
+
+    def _get_last_status(self, exchange, market, indicator_type, indicator, index):
+        """Get the status an indicator had in the previous analysis.
+
+        Args:
+            exchange (str): The exchange of the indicator.
+            market (str): The market pair of the indicator.
+            indicator_type (str): The type of the indicator.
+            indicator (str): The name of the indicator.
+            index (int): The position of the indicator in its configuration list.
+
+        Returns:
+            str: The previous status, or an empty string if there is none.
+        """
+
+        last_market_analysis = self.last_analysis.get(exchange, {}).get(market, {})
+        last_analyses = last_market_analysis.get(indicator_type, {}).get(indicator, [])
+        if index < len(last_analyses):
+            return last_analyses[index].get('status', str())
+        return str()
+
+    def _indicator_message_templater(self, new_analysis, message_template):
         """Creates a message from a user defined template
 
         Args:
             new_analysis (dict): A dictionary of data related to the analysis to send a message about.
-            template (str): A Jinja formatted message template.
+            message_template (Template): A compiled Jinja message template.
 
         Returns:
             str: The templated messages for the notifier.
         """
 
         if not self.last_analysis:
-            self.last_analysis = new_analysis
+            self.last_analysis = dict(new_analysis)
 
         customCode = True
 
-        message_template = Template(template)
+        def format_value(value):
+            return '{:.8f}'.format(value) if isinstance(value, float) else value
+
+        max_hot_notification = self.config.settings["max_hot_notification"]
+        max_cold_notification = self.config.settings["max_cold_notification"]
+
         new_message = str()
-        for exchange in new_analysis:
-            for market in new_analysis[exchange]:
-
-                base_currency, quote_currency = market.split('/')
-
-                sendNotification = False
-                allIndicatorData = {}
-                primaryIndicators = []
-                crossedData = {}
-                informatntData = {}
-                couldCount = 0
-                hotCount = 0
-
-                allIndicatorData["name"] = base_currency + quote_currency
-                allIndicatorData["exchange"] = exchange
-                allIndicatorData["crossed"] = {}
-                allIndicatorData["informants"] = {}
-
-                for indicator_type in new_analysis[exchange][market]:
-
-                    print(indicator_type)
-
-                    for indicator in new_analysis[exchange][market][indicator_type]:
-
-                        for index, analysis in enumerate(new_analysis[exchange][market][indicator_type][indicator]):
-                            if analysis['result'].shape[0] == 0:
-                                continue
-
-                            values = dict()
-                            jsonIndicator = {}
-
-                            if indicator_type == 'informants':
-                                for signal in analysis['config']['signal']:
-                                    latest_result = analysis['result'].iloc[-1]
-
-                                    values[signal] = analysis['result'].iloc[-1][signal]
-                                    if isinstance(values[signal], float):
-                                        values[signal] = format(values[signal], '.8f')
-
-                                informent_result = {"result": values, "config": analysis['config']}
-                                informatntData[indicator] = informent_result
-                                continue
-
-                            elif indicator_type == 'indicators':
-                                for signal in analysis['config']['signal']:
-                                    latest_result = analysis['result'].iloc[-1]
-
-                                    values[signal] = analysis['result'].iloc[-1][signal]
-                                    if isinstance(values[signal], float):
-                                        values[signal] = format(values[signal], '.8f')
-
-                            elif indicator_type == 'crossovers':
-                                latest_result = analysis['result'].iloc[-1]
-                                crosedIndicator = True
-                                allIndicatorData["crosed"] = crosedIndicator
-
-                                key_signal = '{}_{}'.format(
-                                    analysis['config']['key_signal'],
-                                    analysis['config']['key_indicator_index']
-                                )
-
-                                crossed_signal = '{}_{}'.format(
-                                    analysis['config']['crossed_signal'],
-                                    analysis['config']['crossed_indicator_index']
-                                )
-
-                                values[key_signal] = analysis['result'].iloc[-1][key_signal]
-                                if isinstance(values[key_signal], float):
-                                    values[key_signal] = format(values[key_signal], '.8f')
-
-                                values[crossed_signal] = analysis['result'].iloc[-1][crossed_signal]
-                                if isinstance(values[crossed_signal], float):
-                                    values[crossed_signal] = format(values[crossed_signal], '.8f')
-
-                                dataCros = {"name": key_signal[0:-2], "key_value": values[key_signal],
-                                            "crossed_value": values[crossed_signal],
-                                            "is_hot": True if latest_result['is_hot'] else False,
-                                            "is_cold": True if latest_result['is_cold'] else False}
-                                dataCros["key_config"] = \
-                                    new_analysis[exchange][market]['informants'][dataCros["name"]][0]["config"]
-                                dataCros["crossed_config"] = \
-                                    new_analysis[exchange][market]['informants'][dataCros["name"]][1]["config"]
-
-                                crossedData[dataCros["name"]] = dataCros
-                                continue
-
-                            status = 'neutral'
-                            if latest_result['is_hot']:
-                                status = 'hot'
-                                if indicator != "ichimoku" and indicator_type != "informants" and indicator_type != "crossovers":
-                                    hotCount += 1
-                            elif latest_result['is_cold']:
-                                status = 'cold'
-                                if indicator != "ichimoku" and indicator_type != "informants" and indicator_type != "crossovers":
-                                    couldCount += 1
-
-                            # Save status of indicator's new analysis
-                            new_analysis[exchange][market][indicator_type][indicator][index]['status'] = status
-
-                            if latest_result['is_hot'] or latest_result['is_cold'] or customCode:
-                                try:
-                                    last_status = \
-                                        self.last_analysis[exchange][market][indicator_type][indicator][index]['status']
-                                except:
-                                    last_status = str()
-
-                                should_alert = True
-                                try:
-                                    if analysis['config']['alert_frequency'] == 'once':
-                                        if last_status == status:
-                                            should_alert = False
-
-                                    if not analysis['config']['alert_enabled']:
-                                        should_alert = False
-                                except Exception as ex:
-                                    print(ex)
-
-                                jsonIndicator["values"] = values
-                                jsonIndicator["exchange"] = exchange
-                                jsonIndicator["market"] = market
-                                jsonIndicator["base_currency"] = base_currency
-                                jsonIndicator["quote_currency"] = quote_currency
-                                jsonIndicator["indicator"] = indicator
-                                jsonIndicator["indicator_number"] = index
-
-                                jsonIndicator["config"] = analysis['config']
-
-                                jsonIndicator["status"] = status
-                                jsonIndicator["last_status"] = last_status
-
-                                if (latest_result['is_hot'] or latest_result['is_cold']) and should_alert:
-                                    sendNotification = True
-
-                                    primaryIndicators.append(indicator)
-
-                                    new_message += message_template.render(
-                                        values=values,
-                                        exchange=exchange,
-                                        market=market,
-                                        base_currency=base_currency,
-                                        quote_currency=quote_currency,
-                                        indicator=indicator,
-                                        indicator_number=index,
-                                        analysis=analysis,
-                                        status=status,
-                                        last_status=last_status
-                                    )
-
-                                    if len(primaryIndicators) == 0:
-                                        jsonIndicator["primary"] = True
-                                    else:
-                                        jsonIndicator["primary"] = False
-
-                                else:
-                                    jsonIndicator["primary"] = False
-
-                                allIndicatorData[indicator] = jsonIndicator
-                myset = self.config.settings
-                if sendNotification == True and len(primaryIndicators) >= 2 and \
-                        (hotCount >= myset["max_hot_notification"] or couldCount >= myset["max_cold_notification"]):
-                    allIndicatorData["crossed"] = crossedData
-                    allIndicatorData["informants"] = informatntData
-                    print("Hot : " + str(hotCount) + "  cold : " + str(couldCount))
-                    self.notify_custom_telegram(allIndicatorData)
-                    # exit()
+        market_entries = groupby(self._walk(new_analysis), key=lambda entry: entry[:2])
+        for (exchange, market), entries in market_entries:
+            self.logger.debug("Templating %s on %s", market, exchange)
+            entries = list(entries)
+
+            base_currency, quote_currency = market.split('/')
+
+            sendNotification = False
+            allIndicatorData = {}
+            primaryIndicators = []
+            crossedData = {}
+            informatntData = {}
+            couldCount = 0
+            hotCount = 0
+
+            allIndicatorData["name"] = base_currency + quote_currency
+            allIndicatorData["exchange"] = exchange
+            allIndicatorData["crossed"] = {}
+            allIndicatorData["informants"] = {}
+
+            # Indicators that can still add to the hot and cold counts of this market
+            remaining_counted = sum(
+                1 for _, _, indicator_type, indicator, _, _ in entries
+                if indicator != "ichimoku" and indicator_type != "informants" and indicator_type != "crossovers"
+            )
+
+            for _, _, indicator_type, indicator, index, analysis in entries:
+                # Once neither threshold can be reached the market summary won't be sent, so only
+                # the statuses and the templated message still have to be worked out.
+                summary_needed = hotCount + remaining_counted >= max_hot_notification or \
+                    couldCount + remaining_counted >= max_cold_notification
+                if not summary_needed and indicator_type in ('informants', 'crossovers'):
+                    continue
+
+                result = analysis['result']
+                if result.shape[0] == 0:
+                    continue
+
+                analysis_config = analysis['config']
+                values = dict()
+
+                if indicator_type == 'informants':
+                    for signal in analysis_config['signal']:
+                        values[signal] = format_value(result[signal].iat[-1])
+
+                    informent_result = {"result": values, "config": analysis_config}
+                    informatntData[indicator] = informent_result
+                    continue
+
+                elif indicator_type == 'indicators':
+                    for signal in analysis_config['signal']:
+                        values[signal] = format_value(result[signal].iat[-1])
+
+                elif indicator_type == 'crossovers':
+                    crosedIndicator = True
+                    allIndicatorData["crosed"] = crosedIndicator
+
+                    key_signal = '{}_{}'.format(
+                        analysis_config['key_signal'],
+                        analysis_config['key_indicator_index']
+                    )
+
+                    crossed_signal = '{}_{}'.format(
+                        analysis_config['crossed_signal'],
+                        analysis_config['crossed_indicator_index']
+                    )
+
+                    values[key_signal] = format_value(result[key_signal].iat[-1])
+                    values[crossed_signal] = format_value(result[crossed_signal].iat[-1])
+
+                    crossed_name = key_signal[0:-2]
+                    crossed_informant = new_analysis[exchange][market]['informants'][crossed_name]
+                    crossedData[crossed_name] = {
+                        "name": crossed_name,
+                        "key_value": values[key_signal],
+                        "crossed_value": values[crossed_signal],
+                        "is_hot": bool(result['is_hot'].iat[-1]),
+                        "is_cold": bool(result['is_cold'].iat[-1]),
+                        "key_config": crossed_informant[0]["config"],
+                        "crossed_config": crossed_informant[1]["config"]
+                    }
+                    continue
+
+                is_hot = bool(result['is_hot'].iat[-1])
+                is_cold = bool(result['is_cold'].iat[-1])
+
+                counted = indicator != "ichimoku" and indicator_type != "informants" and indicator_type != "crossovers"
+                if counted:
+                    remaining_counted -= 1
+
+                status = 'neutral'
+                if is_hot:
+                    status = 'hot'
+                    if counted:
+                        hotCount += 1
+                elif is_cold:
+                    status = 'cold'
+                    if counted:
+                        couldCount += 1
+
+                # Save status of indicator's new analysis
+                analysis['status'] = status
+
+                if is_hot or is_cold or customCode:
+                    last_status = self._get_last_status(exchange, market, indicator_type, indicator, index)
+
+                    should_alert = True
+                    if analysis_config.get('alert_frequency') == 'once' and last_status == status:
+                        should_alert = False
+
+                    if not analysis_config.get('alert_enabled', True):
+                        should_alert = False
+
+                    primary = False
+                    if (is_hot or is_cold) and should_alert:
+                        sendNotification = True
+
+                        primaryIndicators.append(indicator)
+
+                        new_message += message_template.render(
+                            values=values,
+                            exchange=exchange,
+                            market=market,
+                            base_currency=base_currency,
+                            quote_currency=quote_currency,
+                            indicator=indicator,
+                            indicator_number=index,
+                            analysis=analysis,
+                            status=status,
+                            last_status=last_status
+                        )
+
+                        primary = len(primaryIndicators) == 0
+
+                    if summary_needed:
+                        allIndicatorData[indicator] = {
+                            "values": values,
+                            "exchange": exchange,
+                            "market": market,
+                            "base_currency": base_currency,
+                            "quote_currency": quote_currency,
+                            "indicator": indicator,
+                            "indicator_number": index,
+                            "config": analysis_config,
+                            "status": status,
+                            "last_status": last_status,
+                            "primary": primary
+                        }
+            if sendNotification == True and len(primaryIndicators) >= 2 and \
+                    (hotCount >= max_hot_notification or couldCount >= max_cold_notification):
+                allIndicatorData["crossed"] = crossedData
+                allIndicatorData["informants"] = informatntData
+                self.logger.info("%s hot: %s cold: %s", market, hotCount, couldCount)
+                self.notify_custom_telegram(allIndicatorData)
+                # exit()
 
         # Merge changes from new analysis into last analysis
-        self.last_analysis = {**self.last_analysis, **new_analysis}
+        self.last_analysis.update(new_analysis)
         return new_message
 
     def bollinger_bands_state_calculation(self, upperband, middleband, lowerband, v_close):
@@ -487,11 +597,11 @@ class Notifier():
         message = str()
 
         if primary and (state == "cold" or state == "hot"):
-            message += self.primaryImoji
+            message += PRIMARY_EMOJI
         elif state == "cold":
-            message += self.coldImoji
+            message += COLD_EMOJI
         elif state == "hot":
-            message += self.hotImoji
+            message += HOT_EMOJI
 
         message += "\n"
         return " " + message
@@ -506,34 +616,34 @@ class Notifier():
         # print(json.dumps(objectsData))
 
         try:
-            message = str()
+            message_parts = list()
 
             # Crypto Name
-            message = emojize(":gem:", use_aliases=True) + " #" + objectsData["name"] + "\n"
+            message_parts.append(GEM_EMOJI + " #" + objectsData["name"] + "\n")
 
             # Market Name
-            message += self.config.settings["period_data"] + " / " + objectsData["exchange"] + "\n"
-            message += "#Price -- " + objectsData["informants"]["ohlcv"]["result"]["close"] + " BTC \n\n"
+            message_parts.append(self.config.settings["period_data"] + " / " + objectsData["exchange"] + "\n")
+            message_parts.append("#Price -- " + objectsData["informants"]["ohlcv"]["result"]["close"] + " BTC \n\n")
 
             # MFI
             mfi = objectsData["mfi"]
-            message += "MFI - is " + mfi["status"] + " (" + mfi["values"]["mfi"] + ") "
-            message += self.status_generator(mfi["primary"], mfi["status"])
+            message_parts.append("MFI - is " + mfi["status"] + " (" + mfi["values"]["mfi"] + ") ")
+            message_parts.append(self.status_generator(mfi["primary"], mfi["status"]))
 
             # RSI
             rsi = objectsData["rsi"]
-            message += "RSI - is " + rsi["status"] + " (" + rsi["values"]["rsi"] + ")"
-            message += self.status_generator(rsi["primary"], rsi["status"])
+            message_parts.append("RSI - is " + rsi["status"] + " (" + rsi["values"]["rsi"] + ")")
+            message_parts.append(self.status_generator(rsi["primary"], rsi["status"]))
 
             # STOCH_RSI
             stock_rsi = objectsData["stoch_rsi"]
-            message += "STOCH_RSI - is " + stock_rsi["status"] + " (" + stock_rsi["values"]["stoch_rsi"] + ")"
-            message += self.status_generator(stock_rsi["primary"], stock_rsi["status"])
+            message_parts.append("STOCH_RSI - is " + stock_rsi["status"] + " (" + stock_rsi["values"]["stoch_rsi"] + ")")
+            message_parts.append(self.status_generator(stock_rsi["primary"], stock_rsi["status"]))
 
             # MACD
             macd = objectsData["macd"]
-            message += "MACD - is " + macd["status"] + " (" + macd["values"]["macd"] + ")"
-            message += self.status_generator(macd["primary"], macd["status"])
+            message_parts.append("MACD - is " + macd["status"] + " (" + macd["values"]["macd"] + ")")
+            message_parts.append(self.status_generator(macd["primary"], macd["status"]))
 
             # Bollinder bands
             bb_result = objectsData["informants"]["bollinger_bands"]["result"]
@@ -543,11 +653,11 @@ class Notifier():
                 float(bb_result["lowerband"]),
                 float(objectsData["informants"]["ohlcv"]["result"]["close"])
             )
-            message += "Bollinger Bands - is " + bollinger_bands_state
-            message += self.status_generator(False, bollinger_bands_state)
-            # message += " \t(upperband ===> " + bb_result["upperband"] + ") \n"
-            # message += " \t(middleband ===> " + bb_result["middleband"] + ") \n"
-            # message += " \t(lowerband ===> " + bb_result["lowerband"] + ")"
+            message_parts.append("Bollinger Bands - is " + bollinger_bands_state)
+            message_parts.append(self.status_generator(False, bollinger_bands_state))
+            # message_parts.append(" \t(upperband ===> " + bb_result["upperband"] + ") \n")
+            # message_parts.append(" \t(middleband ===> " + bb_result["middleband"] + ") \n")
+            # message_parts.append(" \t(lowerband ===> " + bb_result["lowerband"] + ")")
 
             # EMA Crossed
             ema = objectsData["crossed"]["ema"]
@@ -560,17 +670,17 @@ class Notifier():
                 ema_key_config,
                 ema_crossed_config
             )
-            message += "Moving Average (ema) " + mva_stat
+            message_parts.append("Moving Average (ema) " + mva_stat)
 
             # ICHIMOKU
             ichimoku = objectsData["ichimoku"]
-            message += "Ichimoku Cloud - is " + ichimoku["status"]
-            message += self.status_generator(ichimoku["primary"], ichimoku["status"])
+            message_parts.append("Ichimoku Cloud - is " + ichimoku["status"])
+            message_parts.append(self.status_generator(ichimoku["primary"], ichimoku["status"]))
+
+            message = "".join(message_parts)
 
             if self.telegram_configured:
                 self.telegram_client.notify(message)
 
-            print(message)
-
         except Exception as ex:
-            print(ex)
+            self.logger.error("Failed to send custom telegram notification: %s", ex)